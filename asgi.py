@@ -0,0 +1,21 @@
+"""
+ASGI entrypoint for the HbA1c validation API
+============================================
+Run with:
+
+    uvicorn asgi:app --workers N
+
+WsgiToAsgi executes each Flask handler on the event loop's bounded
+threadpool, so concurrent requests multiplex on the loop while sklearn
+inference (which releases the GIL during tree traversal) runs in
+threads — instead of one blocked sync worker per in-flight request.
+
+The plain WSGI path (gunicorn -c gunicorn_config.py hba1c_api:app)
+remains supported.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from hba1c_api import app as wsgi_app
+
+app = WsgiToAsgi(wsgi_app)
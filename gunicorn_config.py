@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the HbA1c validation API
+===================================================
+Run with:
+
+    gunicorn -c gunicorn_config.py hba1c_api:app
+
+The Werkzeug dev server (python hba1c_api.py) is single-threaded and
+for development only.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Classic sizing for mixed IO/CPU request handling
+workers = 2 * os.cpu_count() + 1
+threads = 4
+worker_class = "gthread"
+
+# Import (and therefore train) the models once in the master process;
+# workers fork copy-on-write instead of each paying the training cost
+preload_app = True
+
+timeout = 120
+accesslog = "-"
+errorlog = "-"
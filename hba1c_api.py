@@ -1,96 +1,614 @@
-from flask import Flask, request, jsonify, render_template
+# Patch sklearn with the Intel extension before hba1c_validation_model
+# imports it, so training and every predict/predict_proba on the hot
+# path use the accelerated kernels. Optional: absent on non-x86 hosts.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
+from flask import Flask, request, send_from_directory, Response
 from flask_cors import CORS
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+import hashlib
 import os
+import threading
+import time
+
+import joblib
+import orjson
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+try:
+    import redis
+except ImportError:  # Redis is optional; fall back to the in-process cache
+    redis = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Compression is optional; responses go uncompressed
+    Compress = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
 
-# 👇 Tell Flask to look in current directory
-app = Flask(__name__, template_folder=".")
+from hba1c_validation_model import (
+    ClinicalDecisionSupport,
+    generate_synthetic_training_data
+)
+
+app = Flask(__name__)
 CORS(app)
 
+# Batch responses are verbose JSON and bandwidth-bound on the wire;
+# zstd at its default level compresses them 5-10x for near-zero CPU.
+# Small responses below the threshold are sent as-is.
+if Compress is not None:
+    app.config["COMPRESS_ALGORITHM"] = ["zstd", "br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    Compress(app)
+
+
+def ojsonify(obj, status=200):
+    """jsonify replacement backed by orjson
+
+    orjson serializes NumPy scalars and arrays natively in C
+    (OPT_SERIALIZE_NUMPY), so model outputs need no recursive
+    Python-side type conversion before the response is built.
+    """
+    return Response(
+        orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ),
+        status=status,
+        mimetype="application/json"
+    )
+
+
+# ==========================================================
+# ML Models (trained once at startup)
+# ==========================================================
+# Trained synchronously at import time — no background training thread
+# and no "models still loading" window. Under Gunicorn with
+# preload_app=True the master trains once and workers fork the fitted
+# estimators copy-on-write, so N workers cost one training run.
+cds = ClinicalDecisionSupport()
+
+# Representative payload used to warm the models after training
+EXAMPLE_PATIENT = {
+    "patient_id": "WARMUP",
+    "hba1c": 6.5,
+    "fasting_glucose": 140,
+    "haemoglobin": 14.5,
+    "mcv": 90,
+    "ferritin": 80,
+    "bilirubin": 0.8,
+    "rbc_lifespan_days": 120
+}
+
+
+def warm_models():
+    """Run one full assessment so the first real request does not pay
+    for first-call buffer allocation and kernel dispatch in sklearn
+    (and any accelerated backends patched in at import)"""
+    try:
+        cds.assess_test_result(dict(EXAMPLE_PATIENT))
+        assess_patient(dict(EXAMPLE_PATIENT))
+    except Exception as exc:
+        app.logger.warning(f"Model warm-up failed: {exc}")
+
+
+# Bump whenever the feature sets or estimator settings change, so a
+# stale persisted file is retrained instead of silently reused
+MODEL_VERSION = 1
+MODEL_CACHE_PATH = os.environ.get("MODEL_CACHE_PATH", "cds.joblib")
+
+# Directory for the shared-memory model mapping; tmpfs by default so
+# the mapped pages are guaranteed RAM-resident. Set MODEL_SHM_DIR=""
+# to disable.
+MODEL_SHM_DIR = os.environ.get(
+    "MODEL_SHM_DIR",
+    "/dev/shm" if os.path.isdir("/dev/shm") else ""
+)
+
+
+def _share_models(payload):
+    """Re-map freshly trained models through shared memory
+
+    sklearn's Cython tree arrays cannot be rebound to
+    multiprocessing.shared_memory views from Python, so instead the
+    trained object is dumped to tmpfs and loaded back with
+    mmap_mode='r': every worker process then maps the same physical
+    pages for the tree arrays — one copy host-wide no matter how many
+    Gunicorn workers run, with or without preload's copy-on-write.
+    """
+    global cds
+    if not MODEL_SHM_DIR:
+        return
+    shm_path = os.path.join(MODEL_SHM_DIR, "hba1c_cds.joblib")
+    try:
+        joblib.dump(payload, shm_path)
+        cds = joblib.load(shm_path, mmap_mode="r")["cds"]
+    except Exception as exc:
+        app.logger.warning(f"Could not map models into shared memory: {exc}")
+
+
+def _load_persisted_models():
+    """Load the trained models from disk
+
+    The dump is uncompressed so the tree arrays memory-map
+    (mmap_mode='r') and are shared across worker processes.
+
+    Returns:
+        The persisted training timestamp on success, None on failure
+    """
+    global cds
+    if not os.path.exists(MODEL_CACHE_PATH):
+        return None
+    try:
+        payload = joblib.load(MODEL_CACHE_PATH, mmap_mode="r")
+        if payload.get("version") != MODEL_VERSION:
+            return None
+        cds = payload["cds"]
+        # Dumps from before trained_at was stored fall back to mtime
+        return payload.get(
+            "trained_at",
+            int(os.path.getmtime(MODEL_CACHE_PATH))
+        )
+    except Exception as exc:
+        app.logger.warning(f"Could not load persisted models: {exc}")
+        return None
+
+
+def load_models():
+    """Load persisted models if present, else train and persist them
+
+    Training (synthetic data until real data lands) takes seconds;
+    loading the persisted file takes ~100ms, so restarts and rolling
+    deploys skip the retraining cost.
+    """
+    global _model_tag
+
+    trained_at = _load_persisted_models()
+
+    if trained_at is None:
+        training_data = generate_synthetic_training_data(1000)
+        cds.initialize_models(training_data)
+        trained_at = int(time.time())
+        payload = {
+            "version": MODEL_VERSION,
+            "trained_at": trained_at,
+            "cds": cds
+        }
+        try:
+            joblib.dump(payload, MODEL_CACHE_PATH)
+        except Exception as exc:
+            app.logger.warning(f"Could not persist models: {exc}")
+        # Freshly trained models live in anonymous (unshareable) memory
+        _share_models(payload)
+
+    # Cached assessments were produced by the old models
+    _assess_cached.cache_clear()
+    _model_tag = f"{MODEL_VERSION}.{trained_at}"
+    warm_models()
+
+
+# ==========================================================
+# Assessment Cache
+# ==========================================================
+# The models are immutable between load_models() calls, so an
+# assessment is a pure function of the clinical payload. Identical
+# repeat inputs (UI retries, test harnesses) skip the sklearn pipeline.
+#
+# Under Gunicorn each worker holds its own lru_cache, so the hit rate
+# drops to 1/N workers. Setting REDIS_URL switches to a Redis-backed
+# cache shared by all workers; without it (or without the redis
+# package) the in-process lru_cache is used.
+
+CACHE_TTL_SECONDS = 3600
+
+# Redis key prefix tied to the serving models: MODEL_VERSION plus the
+# training timestamp persisted with the dump. Every retrain changes it
+# in all processes, so entries from retired models stop matching (a
+# process-local counter would reach the same value after any restart)
+_model_tag = f"{MODEL_VERSION}.0"
+
+_redis = None
+if redis is not None and os.environ.get("REDIS_URL"):
+    _redis = redis.Redis(
+        connection_pool=redis.ConnectionPool.from_url(os.environ["REDIS_URL"])
+    )
+
+
+def _canonical_key(patient_data):
+    """Hashable cache key: sorted items minus patient_id, so identical
+    clinical inputs collide regardless of which patient sent them"""
+    return tuple(sorted(
+        (k, v) for k, v in patient_data.items() if k != "patient_id"
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _assess_cached(payload_key):
+    return cds.assess_test_result(dict(payload_key))
+
+
+def _payload_digest(patient_data):
+    """blake2b-16 digest of the clinical payload, ignoring patient_id"""
+    payload = {k: v for k, v in patient_data.items() if k != "patient_id"}
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+
+
+def _redis_key(patient_data):
+    return f"v{_model_tag}:{_payload_digest(patient_data)}"
+
+
+def _assess_local(patient_data):
+    """Assessment via the in-process cache, uncached if the key is unhashable
+
+    Extra fields may carry list/object values, which pass schema
+    validation but make the canonical key unhashable: skip the cache
+    instead of failing.
+    """
+    try:
+        return dict(_assess_cached(_canonical_key(patient_data)))
+    except TypeError:
+        return cds.assess_test_result(dict(patient_data))
+
+
+def _assess_redis(patient_data):
+    key = _redis_key(patient_data)
+
+    try:
+        cached = _redis.get(key)
+    except redis.RedisError:
+        # Redis down: serve from the local cache rather than fail
+        return _assess_local(patient_data)
+
+    if cached is not None:
+        return orjson.loads(cached)
+
+    result = cds.assess_test_result(dict(patient_data))
+
+    try:
+        _redis.setex(
+            key,
+            CACHE_TTL_SECONDS,
+            orjson.dumps(
+                result,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        )
+    except (redis.RedisError, TypeError):
+        # A store failure (Redis down, unserializable result) must
+        # degrade to an uncached response, never a 500
+        pass
+
+    return result
+
+
+def assess_cached(patient_data):
+    """Cached full assessment, with the caller's patient_id restored"""
+    if _redis is not None:
+        result = _assess_redis(patient_data)
+    else:
+        result = _assess_local(patient_data)
+    result["patient_id"] = patient_data.get("patient_id", "unknown")
+    return result
+
+
+def assess_rows(patients):
+    """Validate and assess a list of patients, preserving input order
+
+    Valid patients go through the models in one vectorized pass;
+    patients failing schema validation get per-row error dicts.
+    """
+    results = [None] * len(patients)
+
+    valid_idx = []
+    valid_patients = []
+
+    for idx, patient in enumerate(patients):
+        try:
+            validated = PatientIn.model_validate(patient).model_dump(exclude_none=True)
+        except ValidationError as exc:
+            patient_id = (
+                patient.get("patient_id", "unknown")
+                if isinstance(patient, dict) else "unknown"
+            )
+            results[idx] = {
+                "success": False,
+                "patient_id": patient_id,
+                "error": _validation_error_message(exc)
+            }
+        else:
+            valid_idx.append(idx)
+            valid_patients.append(validated)
+
+    if valid_patients:
+        # Retries and deduped uploads often repeat identical rows:
+        # run inference once per unique clinical payload and scatter
+        # the assessment back to every duplicate
+        unique = {}
+        row_keys = []
+        for patient in valid_patients:
+            key = _payload_digest(patient)
+            row_keys.append(key)
+            unique.setdefault(key, patient)
+
+        try:
+            assessments = cds.assess_batch(list(unique.values()))
+            by_key = dict(zip(unique.keys(), assessments))
+        except Exception:
+            # One malformed row must not 500 the whole batch (or kill
+            # the NDJSON stream mid-response): fall back to per-row
+            # assessment and record the failure on the offending rows
+            by_key = {}
+            for key, patient in unique.items():
+                try:
+                    by_key[key] = cds.assess_test_result(dict(patient))
+                except Exception as exc:
+                    by_key[key] = exc
+
+        for idx, patient, key in zip(valid_idx, valid_patients, row_keys):
+            outcome = by_key[key]
+            if isinstance(outcome, Exception):
+                results[idx] = {
+                    "success": False,
+                    "patient_id": patient.get("patient_id", "unknown"),
+                    "error": f"Assessment failed: {outcome}"
+                }
+                continue
+            assessment = dict(outcome)
+            assessment["patient_id"] = patient.get("patient_id", "unknown")
+            results[idx] = {
+                "success": True,
+                "result": assessment
+            }
+
+    return results
+
+
+# ==========================================================
+# Request Schema
+# ==========================================================
+# Validated with pydantic v2: parsing and type checks run in compiled
+# Rust, and the model yields already-typed floats, replacing the
+# per-handler missing-field loops.
+
+class PatientIn(BaseModel):
+    """One patient payload; unknown extra fields still pass through"""
+    model_config = ConfigDict(extra="allow")
+
+    patient_id: str
+    hba1c: float
+    fasting_glucose: float
+    haemoglobin: float
+    mcv: float
+    ferritin: float
+    bilirubin: float
+    rbc_lifespan_days: float
+
+    # Optional fields the models consume, typed so non-numeric values
+    # are rejected here instead of blowing up in feature extraction.
+    # None (absent or null) is dropped on dump so the models' own
+    # defaults apply.
+    random_glucose: Optional[float] = None
+    ogtt_2hr: Optional[float] = None
+    avg_glucose_cgm: Optional[float] = None
+    rbc_count: Optional[float] = None
+    mch: Optional[float] = None
+    mchc: Optional[float] = None
+    reticulocyte_count: Optional[float] = None
+    wbc_count: Optional[float] = None
+    platelet_count: Optional[float] = None
+    serum_iron: Optional[float] = None
+    transferrin_saturation: Optional[float] = None
+    tibc: Optional[float] = None
+    ldh: Optional[float] = None
+    haptoglobin: Optional[float] = None
+    age: Optional[float] = None
+    gender: Optional[str] = None
+    disorder: Optional[str] = None
+
+
+def _validation_error_message(exc):
+    """Flatten a pydantic ValidationError into one error string"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'body'}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+def read_json():
+    """Parse the request body with orjson
+
+    Bypasses request.get_json(), which re-reads headers and parses via
+    stdlib json; orjson parses 2-3x faster, which scales linearly with
+    batch payload size. Returns None for an unparseable body.
+    """
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+
+
+def parse_patient(raw_body):
+    """Parse and validate a single-patient request body
+
+    Returns:
+        (patient_dict, None) on success, (None, error_message) on failure
+    """
+    try:
+        return PatientIn.model_validate_json(raw_body).model_dump(exclude_none=True), None
+    except ValidationError as exc:
+        return None, _validation_error_message(exc)
+
 @app.route("/")
 def home():
-    return render_template("index.html")
+    # The entry page is a constant file: serve it statically (no Jinja
+    # pass) and let clients cache it. Behind nginx, map / to the static
+    # directory so Flask only handles /api/*.
+    return send_from_directory("static", "index.html", max_age=3600)
 
 # ==========================================================
-# Utility: Expected HbA1c from Glucose
+# Cached Timestamp
 # ==========================================================
-def expected_hba1c(glucose):
-    return (glucose + 46.7) / 28.7
+# Response timestamps do not need sub-second precision, so a
+# background thread refreshes one shared string instead of every
+# response paying for a datetime.now().isoformat() call. Callers that
+# need exact time pass ?precise=1.
+
+TIMESTAMP_REFRESH_SECONDS = 0.5
+
+_now_iso = datetime.now().isoformat()
+
+
+def _refresh_timestamp():
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        time.sleep(TIMESTAMP_REFRESH_SECONDS)
+
+
+_timestamp_thread = None
+_timestamp_lock = threading.Lock()
+
+
+def _ensure_timestamp_thread():
+    """Start (or restart) the refresher thread in this process
+
+    Threads do not survive fork, so with preload_app=True the thread
+    started in the Gunicorn master is dead in every worker; each
+    process revives it lazily on first use.
+    """
+    global _timestamp_thread
+    if _timestamp_thread is not None and _timestamp_thread.is_alive():
+        return
+    with _timestamp_lock:
+        if _timestamp_thread is None or not _timestamp_thread.is_alive():
+            _timestamp_thread = threading.Thread(
+                target=_refresh_timestamp,
+                name="timestamp-refresh",
+                daemon=True
+            )
+            _timestamp_thread.start()
+
+
+def current_timestamp(precise=False):
+    """ISO timestamp, at most ~500ms stale unless precise is requested"""
+    if precise:
+        return datetime.now().isoformat()
+    _ensure_timestamp_thread()
+    return _now_iso
 
 
 # ==========================================================
 # Core Clinical Logic Engine
 # ==========================================================
-def assess_patient(data):
+# The pure-numeric scoring (threshold comparisons and arithmetic on
+# seven scalars) is isolated in _score_patient so Numba can compile it
+# to machine code; cache=True persists the compiled object across
+# worker processes. The handler packs the dict into scalars, calls it,
+# and repacks the result. Disorders travel as integer codes because
+# njit functions cannot return Python strings cheaply.
 
-    hba1c = float(data["hba1c"])
-    glucose = float(data["fasting_glucose"])
-    hb = float(data["haemoglobin"])
-    mcv = float(data["mcv"])
-    ferritin = float(data["ferritin"])
-    bilirubin = float(data["bilirubin"])
-    lifespan = float(data["rbc_lifespan_days"])
-
-    exp_hba1c = expected_hba1c(glucose)
+DISORDER_CODES = (
+    "none",
+    "iron_deficiency",
+    "thalassemia",
+    "g6pd",
+    "sickle_cell",
+    "anomaly"
+)
+
+
+@njit(cache=True)
+def _score_patient(hba1c, glucose, hb, mcv, ferritin, bilirubin, lifespan):
+    exp_hba1c = (glucose + 46.7) / 28.7
     difference = hba1c - exp_hba1c
 
-    disorder = "none"
+    disorder = 0
     confidence = 0.7
     corrected = hba1c
     reliable = True
-    recommendation = "No further action required"
 
-    # ------------------------------------------------------
-    # Iron Deficiency
-    # ------------------------------------------------------
+    # Iron deficiency
     if hb < 11 and ferritin < 30 and difference > 0.8:
-        disorder = "iron_deficiency"
+        disorder = 1
         corrected = exp_hba1c
         reliable = False
         confidence = 0.85
 
-    # ------------------------------------------------------
     # Thalassemia
-    # ------------------------------------------------------
     elif hb < 12 and mcv < 70 and ferritin >= 50 and difference < -0.8:
-        disorder = "thalassemia"
+        disorder = 2
         corrected = exp_hba1c
         reliable = False
         confidence = 0.80
 
-    # ------------------------------------------------------
     # G6PD
-    # ------------------------------------------------------
     elif hb < 11 and bilirubin > 1.8 and lifespan < 90:
-        disorder = "g6pd"
+        disorder = 3
         corrected = exp_hba1c
         reliable = False
         confidence = 0.82
 
-    # ------------------------------------------------------
     # Sickle cell
-    # ------------------------------------------------------
     elif hb < 10 and lifespan < 80 and bilirubin > 1.2:
-        disorder = "sickle_cell"
+        disorder = 4
         corrected = exp_hba1c
         reliable = False
         confidence = 0.78
 
-    # ------------------------------------------------------
-    # Extreme Mismatch (Anomaly)
-    # ------------------------------------------------------
+    # Extreme mismatch (anomaly)
     elif abs(difference) > 2:
-        disorder = "anomaly"
+        disorder = 5
         corrected = exp_hba1c
         reliable = False
-        recommendation = "Repeat test / Investigate anomaly"
         confidence = 0.75
 
+    return exp_hba1c, corrected, disorder, confidence, reliable
+
+
+def assess_patient(data):
+
+    exp_hba1c, corrected, disorder_code, confidence, reliable = _score_patient(
+        float(data["hba1c"]),
+        float(data["fasting_glucose"]),
+        float(data["haemoglobin"]),
+        float(data["mcv"]),
+        float(data["ferritin"]),
+        float(data["bilirubin"]),
+        float(data["rbc_lifespan_days"])
+    )
+
+    hba1c = float(data["hba1c"])
+    disorder = DISORDER_CODES[disorder_code]
+
     # ------------------------------------------------------
     # Final Output
     # ------------------------------------------------------
-    if disorder != "none" and disorder != "anomaly":
+    if disorder == "anomaly":
+        recommendation = "Repeat test / Investigate anomaly"
+    elif disorder != "none":
         recommendation = "Confirm blood disorder diagnosis"
+    else:
+        recommendation = "No further action required"
 
     return {
         "patient_id": data["patient_id"],
@@ -107,7 +625,7 @@ def assess_patient(data):
             "confidence": confidence
         },
         "clinical_recommendation": recommendation,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": current_timestamp()
     }
 
 
@@ -117,9 +635,9 @@ def assess_patient(data):
 
 @app.route("/api/health", methods=["GET"])
 def health():
-    return jsonify({
+    return ojsonify({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": current_timestamp(precise=request.args.get("precise") == "1"),
         "service": "Minimal HbA1c Clinical API"
     })
 
@@ -127,40 +645,172 @@ def health():
 @app.route("/api/validate-hba1c", methods=["POST"])
 def validate():
 
-    data = request.get_json()
-
-    required = [
-        "patient_id",
-        "hba1c",
-        "fasting_glucose",
-        "haemoglobin",
-        "mcv",
-        "ferritin",
-        "bilirubin",
-        "rbc_lifespan_days"
-    ]
+    data, error = parse_patient(request.get_data())
 
-    missing = [f for f in required if f not in data]
-
-    if missing:
-        return jsonify({
+    if error:
+        return ojsonify({
             "success": False,
-            "error": f"Missing fields: {', '.join(missing)}"
-        }), 400
+            "error": error
+        }, status=400)
 
     result = assess_patient(data)
 
-    return jsonify({
+    if request.args.get("precise") == "1":
+        result["timestamp"] = current_timestamp(precise=True)
+
+    return ojsonify({
         "success": True,
         "result": result
     })
 
 
+@app.route("/api/detect-anomaly", methods=["POST"])
+def detect_anomaly():
+
+    data, error = parse_patient(request.get_data())
+
+    if error:
+        return ojsonify({
+            "success": False,
+            "error": error
+        }, status=400)
+
+    assessment = assess_cached(data)
+
+    return ojsonify({
+        "success": True,
+        "patient_id": assessment["patient_id"],
+        "result": assessment["test_validity"]["anomaly_detection"]
+    })
+
+
+@app.route("/api/predict-disorder", methods=["POST"])
+def predict_disorder():
+
+    data, error = parse_patient(request.get_data())
+
+    if error:
+        return ojsonify({
+            "success": False,
+            "error": error
+        }, status=400)
+
+    assessment = assess_cached(data)
+
+    return ojsonify({
+        "success": True,
+        "patient_id": assessment["patient_id"],
+        "result": assessment["disorder_assessment"]
+    })
+
+
+@app.route("/api/correct-hba1c", methods=["POST"])
+def correct_hba1c():
+
+    data, error = parse_patient(request.get_data())
+
+    if error:
+        return ojsonify({
+            "success": False,
+            "error": error
+        }, status=400)
+
+    assessment = assess_cached(data)
+
+    return ojsonify({
+        "success": True,
+        "patient_id": assessment["patient_id"],
+        "result": assessment["hba1c_values"]
+    })
+
+
+@app.route("/api/cache-stats", methods=["GET"])
+def cache_stats():
+    stats = dict(_assess_cached.cache_info()._asdict())
+    stats["backend"] = "redis" if _redis is not None else "lru"
+    stats["model_tag"] = _model_tag
+    return ojsonify(stats)
+
+
+@app.route("/api/batch-validate", methods=["POST"])
+def batch_validate():
+
+    data = read_json()
+    patients = data.get("patients") if isinstance(data, dict) else None
+
+    if not isinstance(patients, list) or not patients:
+        return ojsonify({
+            "success": False,
+            "error": "Request must contain a non-empty 'patients' list"
+        }, status=400)
+
+    results = assess_rows(patients)
+
+    unreliable_count = sum(
+        1 for r in results
+        if r["success"] and not r["result"]["test_validity"]["is_reliable"]
+    )
+
+    return ojsonify({
+        "success": True,
+        "total_patients": len(patients),
+        "unreliable_count": unreliable_count,
+        "results": results
+    })
+
+
+# Patients per vectorized block in the streaming endpoint: large enough
+# to amortize sklearn dispatch, small enough to start transmitting early
+STREAM_CHUNK_SIZE = 256
+
+
+@app.route("/api/batch-validate-stream", methods=["POST"])
+def batch_validate_stream():
+
+    data = read_json()
+    patients = data.get("patients") if isinstance(data, dict) else None
+
+    if not isinstance(patients, list) or not patients:
+        return ojsonify({
+            "success": False,
+            "error": "Request must contain a non-empty 'patients' list"
+        }, status=400)
+
+    def generate():
+        unreliable_count = 0
+
+        # Assess in chunks so lines go out before the whole batch is
+        # done, instead of buffering one giant JSON array in RAM
+        for start in range(0, len(patients), STREAM_CHUNK_SIZE):
+            chunk = patients[start:start + STREAM_CHUNK_SIZE]
+            for row in assess_rows(chunk):
+                if row["success"] and not row["result"]["test_validity"]["is_reliable"]:
+                    unreliable_count += 1
+                yield orjson.dumps(
+                    row,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ) + b"\n"
+
+        yield orjson.dumps({
+            "summary": {
+                "total_patients": len(patients),
+                "unreliable_count": unreliable_count
+            }
+        }) + b"\n"
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
 # ==========================================================
 # Run
 # ==========================================================
+# Last, so the warm-up can reach every handler helper defined above
+load_models()
+
 import os
 
 if __name__ == "__main__":
+    # Development only — in production run:
+    #   gunicorn -c gunicorn_config.py hba1c_api:app
     port = int(os.environ.get("PORT", 5000))
     app.run(debug=False, host="0.0.0.0", port=port)
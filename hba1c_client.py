@@ -0,0 +1,86 @@
+"""
+HbA1c API Client Helper
+=======================
+Buffered bulk-ingestion client for the validation API.
+
+Calling /api/validate-hba1c in a hot loop pays one TCP + JSON round
+trip per patient. BufferedClient collects patients locally and flushes
+them to /api/batch-validate in blocks, amortizing serialization and
+round-trip time across the whole block.
+"""
+
+import requests
+
+
+class BufferedClient:
+    """
+    Buffers patients and submits them to /api/batch-validate in blocks
+
+    Usage:
+        with BufferedClient("http://localhost:5000") as client:
+            for patient in patients:
+                client.validate(patient)
+        results = client.results
+    """
+
+    def __init__(self, base_url, flush_at=100, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.flush_at = flush_at
+        self.timeout = timeout
+        self.results = []
+        self._buffer = []
+        # One session reuses the TCP (and TLS) connection across flushes
+        self._session = requests.Session()
+
+    def __enter__(self):
+        self._buffer = []
+        self.results = []
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        self._session.close()
+        return False
+
+    def validate(self, patient_data):
+        """Queue one patient; flushes automatically at the threshold"""
+        self._buffer.append(patient_data)
+        if len(self._buffer) >= self.flush_at:
+            self.flush()
+
+    def flush(self):
+        """Submit all buffered patients in one batch request"""
+        if not self._buffer:
+            return
+
+        response = self._session.post(
+            f"{self.base_url}/api/batch-validate",
+            json={"patients": self._buffer},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        self.results.extend(response.json()["results"])
+        self._buffer = []
+
+
+if __name__ == "__main__":
+    # Small smoke run against a locally running API server
+    example_patient = {
+        "patient_id": "P12345",
+        "hba1c": 7.2,
+        "fasting_glucose": 120,
+        "haemoglobin": 9.5,
+        "mcv": 75,
+        "ferritin": 12,
+        "bilirubin": 0.6,
+        "rbc_lifespan_days": 90
+    }
+
+    with BufferedClient("http://localhost:5000", flush_at=50) as client:
+        for i in range(120):
+            patient = dict(example_patient, patient_id=f"P{i:04d}")
+            client.validate(patient)
+
+    print(f"Validated {len(client.results)} patients")
@@ -31,6 +31,11 @@ import pickle
 import warnings
 warnings.filterwarnings('ignore')
 
+# Feature vectors are built as float32: half the memory bandwidth of
+# float64, and sklearn's tree ensembles evaluate in float32 internally
+# anyway, so float64 inputs would just be copy-converted on every call
+FEATURE_DTYPE = np.float32
+
 
 class HbA1cAnomalyDetector:
     """
@@ -41,51 +46,80 @@ class HbA1cAnomalyDetector:
         self.isolation_forest = IsolationForest(
             contamination=0.1,  # Expect 10% of tests to be anomalous
             random_state=42,
-            n_estimators=100
+            n_estimators=100,
+            n_jobs=-1  # Tree traversal releases the GIL; use all cores
         )
         self.scaler = StandardScaler()
         self.is_trained = False
         
+    # (field, default) pairs in column order; a calculated discrepancy
+    # column between HbA1c and glucose is appended after these
+    FEATURE_FIELDS = (
+        ('hba1c', 5.5),                    # HbA1c test result
+        ('fasting_glucose', 100),          # Should correlate with HbA1c
+        ('random_glucose', 120),
+        ('haemoglobin', 14.0),             # g/dL
+        ('rbc_count', 5.0),                # million cells/µL
+        ('mcv', 90),                       # Mean corpuscular volume
+        ('mch', 30),                       # Mean corpuscular haemoglobin
+        ('mchc', 34),                      # Mean corpuscular haemoglobin concentration
+        ('reticulocyte_count', 1.5),       # %
+        ('serum_iron', 100),               # µg/dL
+        ('ferritin', 50),                  # ng/mL
+        ('transferrin_saturation', 30)     # %
+    )
+
     def extract_features(self, patient_data: dict) -> np.ndarray:
         """
         Extract features for anomaly detection
-        
+
         Args:
             patient_data: Dictionary containing patient information
-        
+
         Returns:
             Feature vector for anomaly detection
         """
-        features = []
-        
-        # HbA1c test result
-        features.append(patient_data.get('hba1c', 5.5))
-        
-        # Fasting blood glucose (should correlate with HbA1c)
-        features.append(patient_data.get('fasting_glucose', 100))
-        
-        # Random blood glucose
-        features.append(patient_data.get('random_glucose', 120))
-        
-        # Haematological parameters
-        features.append(patient_data.get('haemoglobin', 14.0))  # g/dL
-        features.append(patient_data.get('rbc_count', 5.0))  # million cells/µL
-        features.append(patient_data.get('mcv', 90))  # Mean corpuscular volume
-        features.append(patient_data.get('mch', 30))  # Mean corpuscular haemoglobin
-        features.append(patient_data.get('mchc', 34))  # Mean corpuscular haemoglobin concentration
-        features.append(patient_data.get('reticulocyte_count', 1.5))  # %
-        
-        # Iron studies
-        features.append(patient_data.get('serum_iron', 100))  # µg/dL
-        features.append(patient_data.get('ferritin', 50))  # ng/mL
-        features.append(patient_data.get('transferrin_saturation', 30))  # %
-        
+        features = [
+            patient_data.get(field, default)
+            for field, default in self.FEATURE_FIELDS
+        ]
+
         # Calculated discrepancy between HbA1c and glucose
         expected_hba1c = (patient_data.get('fasting_glucose', 100) + 46.7) / 28.7
         actual_hba1c = patient_data.get('hba1c', 5.5)
         features.append(abs(actual_hba1c - expected_hba1c))
-        
-        return np.array(features)
+
+        return np.array(features, dtype=FEATURE_DTYPE)
+
+    def extract_features_batch(self, patient_records: list) -> np.ndarray:
+        """
+        Build the feature matrix for a batch structure-of-arrays style
+
+        One contiguous NumPy column per feature, then a single
+        column_stack — no per-patient row boxing, and the discrepancy
+        column is computed by broadcasting over whole arrays.
+
+        Args:
+            patient_records: List of patient data dictionaries
+
+        Returns:
+            2D feature matrix, one row per patient
+        """
+        count = len(patient_records)
+        columns = [
+            np.fromiter(
+                (p.get(field, default) for p in patient_records),
+                dtype=FEATURE_DTYPE,
+                count=count
+            )
+            for field, default in self.FEATURE_FIELDS
+        ]
+
+        # Calculated discrepancy between HbA1c and glucose
+        expected_hba1c = (columns[1] + 46.7) / 28.7
+        columns.append(np.abs(columns[0] - expected_hba1c))
+
+        return np.column_stack(columns)
     
     def train(self, patient_records: list):
         """
@@ -94,39 +128,70 @@ class HbA1cAnomalyDetector:
         Args:
             patient_records: List of patient data dictionaries
         """
-        X = []
-        for record in patient_records:
-            features = self.extract_features(record)
-            X.append(features)
-        
-        X = np.array(X)
+        X = self.extract_features_batch(patient_records)
         X_scaled = self.scaler.fit_transform(X)
-        
+
         self.isolation_forest.fit(X_scaled)
         self.is_trained = True
         
-    def detect_anomaly(self, patient_data: dict) -> dict:
+    def detect_anomaly(self, patient_data: dict, features: np.ndarray = None) -> dict:
         """
         Detect if HbA1c result is potentially false
-        
+
+        Args:
+            patient_data: Dictionary containing patient information
+            features: Pre-extracted feature vector, to avoid re-marshaling
+                the dict when the caller already built it
+
         Returns:
             Dictionary with anomaly score and assessment
         """
         if not self.is_trained:
             return {'is_anomalous': False, 'confidence': 0.0, 'message': 'Model not trained'}
-        
-        features = self.extract_features(patient_data).reshape(1, -1)
-        features_scaled = self.scaler.transform(features)
+
+        if features is None:
+            features = self.extract_features(patient_data)
+        features_scaled = self.scaler.transform(features.reshape(1, -1))
         
         # Get anomaly score (-1 = anomaly, 1 = normal)
         prediction = self.isolation_forest.predict(features_scaled)[0]
         anomaly_score = self.isolation_forest.score_samples(features_scaled)[0]
         
+        return self._build_assessment(prediction, anomaly_score)
+
+    def detect_anomaly_batch(self, feature_matrix: np.ndarray) -> list:
+        """
+        Detect anomalies for a batch of patients with a single model call
+
+        Args:
+            feature_matrix: 2D array with one extract_features() row per patient
+
+        Returns:
+            List of per-patient anomaly assessments (same format as detect_anomaly)
+        """
+        if not self.is_trained:
+            return [
+                {'is_anomalous': False, 'confidence': 0.0, 'message': 'Model not trained'}
+                for _ in range(len(feature_matrix))
+            ]
+
+        features_scaled = self.scaler.transform(feature_matrix)
+
+        predictions = self.isolation_forest.predict(features_scaled)
+        anomaly_scores = self.isolation_forest.score_samples(features_scaled)
+
+        return [
+            self._build_assessment(prediction, anomaly_score)
+            for prediction, anomaly_score in zip(predictions, anomaly_scores)
+        ]
+
+    def _build_assessment(self, prediction, anomaly_score) -> dict:
+        """Assemble the anomaly assessment dict for one prediction"""
         is_anomalous = bool(prediction == -1)
-        
+
         # Convert score to confidence (0-1 scale)
         confidence = abs(anomaly_score)
-        
+
         # Assess severity
         if is_anomalous:
             if confidence > 0.5:
@@ -141,7 +206,7 @@ class HbA1cAnomalyDetector:
         else:
             severity = 'NONE'
             message = 'Test result appears reliable'
-        
+
         return {
             'is_anomalous': bool(is_anomalous),
             'anomaly_score': float(anomaly_score),
@@ -160,42 +225,76 @@ class BloodDisorderClassifier:
         self.classifier = RandomForestClassifier(
             n_estimators=100,
             max_depth=10,
-            random_state=42
+            random_state=42,
+            n_jobs=-1  # Tree traversal releases the GIL; use all cores
         )
         self.scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
         self.is_trained = False
         
-    def extract_features(self, patient_data: dict) -> np.ndarray:
-        """Extract features for disorder classification"""
-        features = []
-        
+    # (field, default) pairs in column order; a gender indicator column
+    # (1 = female) is appended after these
+    FEATURE_FIELDS = (
         # Complete blood count
-        features.append(patient_data.get('haemoglobin', 14.0))
-        features.append(patient_data.get('rbc_count', 5.0))
-        features.append(patient_data.get('mcv', 90))
-        features.append(patient_data.get('mch', 30))
-        features.append(patient_data.get('mchc', 34))
-        features.append(patient_data.get('reticulocyte_count', 1.5))
-        features.append(patient_data.get('wbc_count', 7.0))
-        features.append(patient_data.get('platelet_count', 250))
-        
+        ('haemoglobin', 14.0),
+        ('rbc_count', 5.0),
+        ('mcv', 90),
+        ('mch', 30),
+        ('mchc', 34),
+        ('reticulocyte_count', 1.5),
+        ('wbc_count', 7.0),
+        ('platelet_count', 250),
         # Iron studies
-        features.append(patient_data.get('serum_iron', 100))
-        features.append(patient_data.get('ferritin', 50))
-        features.append(patient_data.get('transferrin_saturation', 30))
-        features.append(patient_data.get('tibc', 300))  # Total iron binding capacity
-        
+        ('serum_iron', 100),
+        ('ferritin', 50),
+        ('transferrin_saturation', 30),
+        ('tibc', 300),                     # Total iron binding capacity
         # Additional markers
-        features.append(patient_data.get('bilirubin', 0.8))
-        features.append(patient_data.get('ldh', 150))  # Lactate dehydrogenase
-        features.append(patient_data.get('haptoglobin', 100))
-        
+        ('bilirubin', 0.8),
+        ('ldh', 150),                      # Lactate dehydrogenase
+        ('haptoglobin', 100),
         # Demographics (risk factors)
-        features.append(patient_data.get('age', 40))
+        ('age', 40)
+    )
+
+    def extract_features(self, patient_data: dict) -> np.ndarray:
+        """Extract features for disorder classification"""
+        features = [
+            patient_data.get(field, default)
+            for field, default in self.FEATURE_FIELDS
+        ]
+
         features.append(1 if patient_data.get('gender', 'M') == 'F' else 0)
-        
-        return np.array(features)
+
+        return np.array(features, dtype=FEATURE_DTYPE)
+
+    def extract_features_batch(self, patient_records: list) -> np.ndarray:
+        """
+        Build the feature matrix for a batch structure-of-arrays style
+
+        Args:
+            patient_records: List of patient data dictionaries
+
+        Returns:
+            2D feature matrix, one row per patient
+        """
+        count = len(patient_records)
+        columns = [
+            np.fromiter(
+                (p.get(field, default) for p in patient_records),
+                dtype=FEATURE_DTYPE,
+                count=count
+            )
+            for field, default in self.FEATURE_FIELDS
+        ]
+
+        columns.append(np.fromiter(
+            (1.0 if p.get('gender', 'M') == 'F' else 0.0 for p in patient_records),
+            dtype=FEATURE_DTYPE,
+            count=count
+        ))
+
+        return np.column_stack(columns)
     
     def train(self, patient_records: list, labels: list):
         """
@@ -206,43 +305,76 @@ class BloodDisorderClassifier:
             labels: List of disorder types
                     ('none', 'iron_deficiency', 'thalassemia', 'sickle_cell', 'g6pd')
         """
-        X = []
-        for record in patient_records:
-            features = self.extract_features(record)
-            X.append(features)
-        
-        X = np.array(X)
+        X = self.extract_features_batch(patient_records)
         X_scaled = self.scaler.fit_transform(X)
-        
+
         y = self.label_encoder.fit_transform(labels)
         
         self.classifier.fit(X_scaled, y)
         self.is_trained = True
         
-    def predict_disorder(self, patient_data: dict) -> dict:
+    def predict_disorder(self, patient_data: dict, features: np.ndarray = None) -> dict:
         """
         Predict blood disorder type and probability
-        
+
+        Args:
+            patient_data: Dictionary containing patient information
+            features: Pre-extracted feature vector, to avoid re-marshaling
+                the dict when the caller already built it
+
         Returns:
             Dictionary with disorder prediction and probabilities
         """
         if not self.is_trained:
             return {'disorder': 'unknown', 'confidence': 0.0}
-        
-        features = self.extract_features(patient_data).reshape(1, -1)
-        features_scaled = self.scaler.transform(features)
+
+        if features is None:
+            features = self.extract_features(patient_data)
+        features_scaled = self.scaler.transform(features.reshape(1, -1))
         
         prediction = self.classifier.predict(features_scaled)[0]
         probabilities = self.classifier.predict_proba(features_scaled)[0]
-        
-        disorder = self.label_encoder.inverse_transform([prediction])[0]
+
+        return self._build_assessment(prediction, probabilities)
+
+    def predict_disorder_batch(self, feature_matrix: np.ndarray) -> list:
+        """
+        Predict disorders for a batch of patients with a single model call
+
+        Args:
+            feature_matrix: 2D array with one extract_features() row per patient
+
+        Returns:
+            List of per-patient disorder predictions (same format as predict_disorder)
+        """
+        if not self.is_trained:
+            return [
+                {'disorder': 'unknown', 'confidence': 0.0}
+                for _ in range(len(feature_matrix))
+            ]
+
+        features_scaled = self.scaler.transform(feature_matrix)
+
+        predictions = self.classifier.predict(features_scaled)
+        probabilities = self.classifier.predict_proba(features_scaled)
+
+        return [
+            self._build_assessment(prediction, probs)
+            for prediction, probs in zip(predictions, probabilities)
+        ]
+
+    def _build_assessment(self, prediction, probabilities) -> dict:
+        """Assemble the disorder prediction dict for one prediction"""
+        # label_encoder yields numpy.str_; cast so the output dict has
+        # plain-str keys and values for every JSON serializer
+        disorder = str(self.label_encoder.inverse_transform([prediction])[0])
         confidence = float(max(probabilities))
-        
+
         # Get all disorder probabilities
         disorder_probs = {}
         for idx, disorder_name in enumerate(self.label_encoder.classes_):
-            disorder_probs[disorder_name] = float(probabilities[idx])
-        
+            disorder_probs[str(disorder_name)] = float(probabilities[idx])
+
         return {
             'predicted_disorder': disorder,
             'confidence': confidence,
@@ -265,40 +397,80 @@ class CorrectedHbA1cPredictor:
         self.scaler = StandardScaler()
         self.is_trained = False
         
-    def extract_features(self, patient_data: dict) -> np.ndarray:
-        """Extract features for HbA1c correction"""
-        features = []
-        
-        # Measured HbA1c (potentially false)
-        features.append(patient_data.get('hba1c', 5.5))
-        
+    # (field, default) pairs in column order; one-hot disorder
+    # indicator columns and the RBC lifespan column follow these
+    FEATURE_FIELDS = (
+        ('hba1c', 5.5),                    # Measured HbA1c (potentially false)
         # Glucose measurements (ground truth indicators)
-        features.append(patient_data.get('fasting_glucose', 100))
-        features.append(patient_data.get('random_glucose', 120))
-        features.append(patient_data.get('ogtt_2hr', 140))  # Oral glucose tolerance test
-        
-        # Average glucose from CGM if available
-        features.append(patient_data.get('avg_glucose_cgm', 110))
-        
+        ('fasting_glucose', 100),
+        ('random_glucose', 120),
+        ('ogtt_2hr', 140),                 # Oral glucose tolerance test
+        ('avg_glucose_cgm', 110),          # Average glucose from CGM if available
         # Haematological parameters
-        features.append(patient_data.get('haemoglobin', 14.0))
-        features.append(patient_data.get('rbc_count', 5.0))
-        features.append(patient_data.get('mcv', 90))
-        features.append(patient_data.get('reticulocyte_count', 1.5))
-        
+        ('haemoglobin', 14.0),
+        ('rbc_count', 5.0),
+        ('mcv', 90),
+        ('reticulocyte_count', 1.5),
         # Iron status
-        features.append(patient_data.get('serum_iron', 100))
-        features.append(patient_data.get('ferritin', 50))
-        
+        ('serum_iron', 100),
+        ('ferritin', 50)
+    )
+
+    # One-hot encoded disorder indicators
+    DISORDER_FIELDS = ('iron_deficiency', 'thalassemia', 'sickle_cell', 'g6pd')
+
+    def extract_features(self, patient_data: dict) -> np.ndarray:
+        """Extract features for HbA1c correction"""
+        features = [
+            patient_data.get(field, default)
+            for field, default in self.FEATURE_FIELDS
+        ]
+
         # Disorder indicators (one-hot encoded)
-        disorders = ['iron_deficiency', 'thalassemia', 'sickle_cell', 'g6pd']
-        for disorder in disorders:
+        for disorder in self.DISORDER_FIELDS:
             features.append(1 if patient_data.get('disorder') == disorder else 0)
-        
+
         # RBC lifespan indicator (affects HbA1c formation)
         features.append(patient_data.get('rbc_lifespan_days', 120))
-        
-        return np.array(features)
+
+        return np.array(features, dtype=FEATURE_DTYPE)
+
+    def extract_features_batch(self, patient_records: list) -> np.ndarray:
+        """
+        Build the feature matrix for a batch structure-of-arrays style
+
+        Args:
+            patient_records: List of patient data dictionaries
+
+        Returns:
+            2D feature matrix, one row per patient
+        """
+        count = len(patient_records)
+        columns = [
+            np.fromiter(
+                (p.get(field, default) for p in patient_records),
+                dtype=FEATURE_DTYPE,
+                count=count
+            )
+            for field, default in self.FEATURE_FIELDS
+        ]
+
+        # Disorder indicators (one-hot encoded)
+        for disorder in self.DISORDER_FIELDS:
+            columns.append(np.fromiter(
+                (1.0 if p.get('disorder') == disorder else 0.0 for p in patient_records),
+                dtype=FEATURE_DTYPE,
+                count=count
+            ))
+
+        # RBC lifespan indicator (affects HbA1c formation)
+        columns.append(np.fromiter(
+            (p.get('rbc_lifespan_days', 120) for p in patient_records),
+            dtype=FEATURE_DTYPE,
+            count=count
+        ))
+
+        return np.column_stack(columns)
     
     def train(self, patient_records: list, true_hba1c: list):
         """
@@ -308,12 +480,7 @@ class CorrectedHbA1cPredictor:
             patient_records: List of patient data with measured (false) HbA1c
             true_hba1c: List of true HbA1c values (from OGTT or CGM)
         """
-        X = []
-        for record in patient_records:
-            features = self.extract_features(record)
-            X.append(features)
-        
-        X = np.array(X)
+        X = self.extract_features_batch(patient_records)
         y = np.array(true_hba1c)
         
         X_scaled = self.scaler.fit_transform(X)
@@ -321,10 +488,15 @@ class CorrectedHbA1cPredictor:
         self.regressor.fit(X_scaled, y)
         self.is_trained = True
         
-    def predict_corrected_hba1c(self, patient_data: dict) -> dict:
+    def predict_corrected_hba1c(self, patient_data: dict, features: np.ndarray = None) -> dict:
         """
         Predict corrected HbA1c value
-        
+
+        Args:
+            patient_data: Dictionary containing patient information
+            features: Pre-extracted feature vector, to avoid re-marshaling
+                the dict when the caller already built it
+
         Returns:
             Dictionary with corrected value and confidence interval
         """
@@ -334,16 +506,56 @@ class CorrectedHbA1cPredictor:
                 'confidence': 0.0,
                 'correction_applied': False
             }
-        
-        features = self.extract_features(patient_data).reshape(1, -1)
-        features_scaled = self.scaler.transform(features)
+
+        if features is None:
+            features = self.extract_features(patient_data)
+        features_scaled = self.scaler.transform(features.reshape(1, -1))
         
         corrected_hba1c = self.regressor.predict(features_scaled)[0]
-        
-        # Calculate correction magnitude
+
         measured_hba1c = patient_data.get('hba1c', 5.5)
+
+        return self._build_assessment(corrected_hba1c, measured_hba1c)
+
+    def predict_corrected_hba1c_batch(
+        self,
+        feature_matrix: np.ndarray,
+        measured_values: list
+    ) -> list:
+        """
+        Predict corrected HbA1c for a batch of patients with a single model call
+
+        Args:
+            feature_matrix: 2D array with one extract_features() row per patient
+            measured_values: Measured HbA1c value for each row
+
+        Returns:
+            List of per-patient corrections (same format as predict_corrected_hba1c)
+        """
+        if not self.is_trained:
+            return [
+                {
+                    'corrected_hba1c': measured,
+                    'confidence': 0.0,
+                    'correction_applied': False
+                }
+                for measured in measured_values
+            ]
+
+        features_scaled = self.scaler.transform(feature_matrix)
+
+        corrected_values = self.regressor.predict(features_scaled)
+
+        return [
+            self._build_assessment(corrected, measured)
+            for corrected, measured in zip(corrected_values, measured_values)
+        ]
+
+    def _build_assessment(self, corrected_hba1c, measured_hba1c) -> dict:
+        """Assemble the correction dict for one prediction"""
+        # Calculate correction magnitude
         correction = corrected_hba1c - measured_hba1c
-        
+
         return {
             'measured_hba1c': float(measured_hba1c),
             'corrected_hba1c': float(corrected_hba1c),
@@ -359,11 +571,17 @@ class ClinicalDecisionSupport:
     Integrates all models to provide clinical recommendations
     """
     
+    # Bound on the memoized dict -> feature-rows cache
+    FEATURE_CACHE_SIZE = 1024
+
     def __init__(self):
         self.anomaly_detector = HbA1cAnomalyDetector()
         self.disorder_classifier = BloodDisorderClassifier()
         self.hba1c_corrector = CorrectedHbA1cPredictor()
-        
+        # Feature rows depend only on the payload, never on the trained
+        # models, so entries stay valid across retraining
+        self._feature_cache = {}
+
     def initialize_models(self, training_data: dict):
         """
         Initialize all models with training data
@@ -393,30 +611,127 @@ class ClinicalDecisionSupport:
                 training_data['true_hba1c']
             )
     
+    def extract_feature_rows(self, patient_data: dict) -> tuple:
+        """
+        Build the per-model feature vectors for one patient exactly once
+
+        Marshaling the dict into NumPy rows is deterministic and shared
+        by all three models, so results are memoized on the canonicalized
+        payload (identical clinical inputs hit the cache).
+
+        Returns:
+            Tuple of (anomaly, disorder, correction) feature vectors
+        """
+        # Building the tuple never raises (keys are distinct strings,
+        # so values are never compared); hashing it in the lookup does.
+        # A single guarded read also cannot race a concurrent clear()
+        # the way a separate "in" check followed by a read could.
+        key = tuple(sorted(patient_data.items()))
+        try:
+            return self._feature_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            key = None  # Unhashable values: skip the cache
+
+        rows = (
+            self.anomaly_detector.extract_features(patient_data),
+            self.disorder_classifier.extract_features(patient_data),
+            self.hba1c_corrector.extract_features(patient_data)
+        )
+
+        if key is not None:
+            if len(self._feature_cache) >= self.FEATURE_CACHE_SIZE:
+                self._feature_cache.clear()
+            self._feature_cache[key] = rows
+
+        return rows
+
     def assess_test_result(self, patient_data: dict) -> dict:
         """
         Comprehensive assessment of HbA1c test result
-        
+
         Returns:
             Complete clinical decision support output
         """
+        anomaly_row, disorder_row, correction_row = self.extract_feature_rows(patient_data)
+
         # Step 1: Detect anomalies
-        anomaly_result = self.anomaly_detector.detect_anomaly(patient_data)
-        
+        anomaly_result = self.anomaly_detector.detect_anomaly(
+            patient_data, features=anomaly_row
+        )
+
         # Step 2: Classify potential disorder
-        disorder_result = self.disorder_classifier.predict_disorder(patient_data)
-        
+        disorder_result = self.disorder_classifier.predict_disorder(
+            patient_data, features=disorder_row
+        )
+
         # Step 3: Predict corrected HbA1c
-        correction_result = self.hba1c_corrector.predict_corrected_hba1c(patient_data)
-        
-        # Step 4: Generate recommendations
+        correction_result = self.hba1c_corrector.predict_corrected_hba1c(
+            patient_data, features=correction_row
+        )
+
+        # Step 4: Assemble report with recommendations
+        return self._build_report(
+            patient_data,
+            anomaly_result,
+            disorder_result,
+            correction_result
+        )
+
+    def assess_batch(self, patient_records: list) -> list:
+        """
+        Assess a batch of patients with one model call per underlying model
+
+        Stacking all feature rows and predicting once avoids the per-row
+        sklearn dispatch overhead of calling assess_test_result in a loop.
+
+        Args:
+            patient_records: List of patient data dictionaries
+
+        Returns:
+            List of assessments, one per patient, in input order
+            (same format as assess_test_result)
+        """
+        if not patient_records:
+            return []
+
+        # Build one contiguous feature matrix per model,
+        # structure-of-arrays style (one column per feature)
+        anomaly_matrix = self.anomaly_detector.extract_features_batch(patient_records)
+        disorder_matrix = self.disorder_classifier.extract_features_batch(patient_records)
+        correction_matrix = self.hba1c_corrector.extract_features_batch(patient_records)
+        measured_values = [p.get('hba1c', 5.5) for p in patient_records]
+
+        # One vectorized pass per model
+        anomaly_results = self.anomaly_detector.detect_anomaly_batch(anomaly_matrix)
+        disorder_results = self.disorder_classifier.predict_disorder_batch(disorder_matrix)
+        correction_results = self.hba1c_corrector.predict_corrected_hba1c_batch(
+            correction_matrix,
+            measured_values
+        )
+
+        return [
+            self._build_report(patient_data, anomaly_result, disorder_result, correction_result)
+            for patient_data, anomaly_result, disorder_result, correction_result
+            in zip(patient_records, anomaly_results, disorder_results, correction_results)
+        ]
+
+    def _build_report(
+        self,
+        patient_data: dict,
+        anomaly_result: dict,
+        disorder_result: dict,
+        correction_result: dict
+    ) -> dict:
+        """Assemble the full assessment report for one patient"""
         recommendations = self._generate_recommendations(
             anomaly_result,
             disorder_result,
             correction_result,
             patient_data
         )
-        
+
         return {
             'patient_id': patient_data.get('patient_id', 'unknown'),
             'test_validity': {